@@ -15,11 +15,11 @@
 """Classes for specifying `Bloq.registers`."""
 import enum
 import itertools
+import math
 from collections import defaultdict
 from typing import cast, Dict, Iterable, Iterator, List, overload, Tuple, Union
 
 import attrs
-import numpy as np
 import sympy
 from attrs import field, frozen
 
@@ -99,7 +99,7 @@ class Register:
 
         This is the product of bitsize and each of the dimensions in `shape`.
         """
-        return self.bitsize * int(np.prod(self.shape))
+        return self.bitsize * int(math.prod(self.shape))
 
     def adjoint(self) -> 'Register':
         """Return the 'adjoint' of this register by switching RIGHT and LEFT registers."""
@@ -34,10 +34,13 @@ from qualtran.drawing import Text, TextBox, WireSymbol
 if TYPE_CHECKING:
     import cirq
     import quimb.tensor as qtn
+    from numpy.typing import NDArray
 
     from qualtran.cirq_interop import CirqQuregT
     from qualtran.simulation.classical_sim import ClassicalValT
 
+_IDENTITY = np.eye(2, dtype=np.complex128)
+
 
 @frozen
 class Identity(Bloq):
@@ -67,7 +70,11 @@ class Identity(Bloq):
     ):
         import quimb.tensor as qtn
 
-        tn.add(qtn.Tensor(data=np.eye(2), inds=(outgoing['q'], incoming['q']), tags=["I", tag]))
+        tn.add(qtn.Tensor(data=_IDENTITY, inds=(outgoing['q'], incoming['q']), tags=["I", tag]))
+
+    def tensor_contract(self) -> 'NDArray':
+        # The unitary is known; skip building and contracting a tensor network.
+        return _IDENTITY.copy()
 
     def as_cirq_op(
         self, qubit_manager: 'cirq.QubitManager', q: 'CirqQuregT'  # type: ignore[type-var]
@@ -21,6 +21,7 @@ from qualtran.simulation.classical_sim import (
     format_classical_truth_table,
     get_classical_truth_table,
 )
+from qualtran.simulation.tensor import bloq_to_dense
 
 
 def test_to_cirq():
@@ -44,6 +45,7 @@ def test_unitary_vs_cirq():
     unitary = i.tensor_contract()
     cirq_unitary = cirq.unitary(cirq.I)
     np.testing.assert_allclose(unitary, cirq_unitary)
+    np.testing.assert_allclose(unitary, bloq_to_dense(i))
 
 
 def test_i_truth_table():
@@ -14,16 +14,20 @@
 
 """Classes to apply single qubit bloq to multiple qubits."""
 from functools import cached_property
-from typing import Dict, Optional, Set, Tuple
+from typing import Any, Dict, Optional, Set, Tuple, TYPE_CHECKING
 
 import attrs
+import numpy as np
 import sympy
 
 from qualtran import Bloq, BloqBuilder, QAny, Register, Signature, Soquet, SoquetT
 from qualtran.drawing import Text, WireSymbol
 from qualtran.drawing.musical_score import TextBox
 from qualtran.resource_counting import BloqCountT, SympySymbolAllocator
-from qualtran.symbolics import SymbolicInt
+from qualtran.symbolics import is_symbolic, SymbolicInt
+
+if TYPE_CHECKING:
+    import quimb.tensor as qtn
 
 
 @attrs.frozen
@@ -59,6 +63,32 @@ class OnEach(Bloq):
             qs[i] = bb.add(self.gate, q=qs[i])
         return {'q': bb.join(qs)}
 
+    def add_my_tensors(
+        self,
+        tn: 'qtn.TensorNetwork',
+        tag: Any,
+        *,
+        incoming: Dict[str, 'SoquetT'],
+        outgoing: Dict[str, 'SoquetT'],
+    ):
+        if is_symbolic(self.n):
+            return super().add_my_tensors(tn, tag, incoming=incoming, outgoing=outgoing)
+
+        import quimb.tensor as qtn
+
+        # Add one tensor for the whole register rather than one per qubit. The n-fold tensor
+        # power of the gate is built by repeated squaring.
+        power = self.gate.tensor_contract()
+        unitary = np.ones((1, 1))
+        n = int(self.n)
+        while n:
+            if n & 1:
+                unitary = np.kron(unitary, power)
+            n >>= 1
+            if n:
+                power = np.kron(power, power)
+        tn.add(qtn.Tensor(data=unitary, inds=(outgoing['q'], incoming['q']), tags=[str(self), tag]))
+
     def build_call_graph(self, ssa: 'SympySymbolAllocator') -> Set['BloqCountT']:
         return {(self.gate, self.n)}
 
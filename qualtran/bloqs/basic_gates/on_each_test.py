@@ -32,6 +32,7 @@ def test_tensor_contract():
     tensor = bloq.tensor_contract()
     single_had = Hadamard().tensor_contract()
     np.testing.assert_allclose(tensor, reduce(np.kron, (single_had,) * 5))
+    np.testing.assert_allclose(tensor, bloq.decompose_bloq().tensor_contract())
 
 
 def test_classical_simulation():
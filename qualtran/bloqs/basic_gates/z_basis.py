@@ -356,10 +356,8 @@ class _IntVector(Bloq):
 
         if isinstance(self.bitsize, sympy.Expr):
             raise ValueError(f'Symbolic bitsize {self.bitsize} not supported')
-        data = np.zeros(2**self.bitsize).reshape((2,) * self.bitsize)
-        bitstring = ints_to_bits(np.array([self.val]), w=self.bitsize)[0]
-        data[tuple(bitstring)] = 1
-        data = data.reshape(-1)
+        data = np.zeros(2**self.bitsize)
+        data[self.val] = 1
 
         if self.state:
             inds = (outgoing['val'],)
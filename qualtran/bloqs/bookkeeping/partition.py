@@ -25,12 +25,13 @@ from qualtran.simulation.classical_sim import bits_to_ints, ints_to_bits
 
 if TYPE_CHECKING:
     import quimb.tensor as qtn
+    from numpy.typing import NDArray
 
     from qualtran.cirq_interop import CirqQuregT
     from qualtran.simulation.classical_sim import ClassicalValT
 
 
-@frozen
+@frozen(cache_hash=True)
 class Partition(_BookkeepingBloq):
     """Partition a generic index into multiple registers.
 
@@ -63,13 +64,10 @@ class Partition(_BookkeepingBloq):
 
     def as_cirq_op(self, qubit_manager, **cirq_quregs) -> Tuple[None, Dict[str, 'CirqQuregT']]:
         if self.partition:
+            x = np.asarray(cirq_quregs['x'])
             outregs = {}
-            start = 0
-            for reg in self.regs:
-                shape = reg.shape + (reg.bitsize,)
-                size = int(np.prod(shape))
-                outregs[reg.name] = np.array(cirq_quregs['x'][start : start + size]).reshape(shape)
-                start += size
+            for reg, start, size in zip(self.regs, *self._reg_layout):
+                outregs[reg.name] = x[start : start + size].reshape(reg.shape + (reg.bitsize,))
             return None, outregs
         else:
             return None, {'x': np.concatenate([v.ravel() for _, v in cirq_quregs.items()])}
@@ -84,61 +82,95 @@ class Partition(_BookkeepingBloq):
     ):
         import quimb.tensor as qtn
 
-        unitary_shape = []
         soquets = []
         _incoming = incoming if self.partition else outgoing
         _outgoing = outgoing if self.partition else incoming
         for reg in self.regs:
-            for i in range(int(np.prod(reg.shape))):
-                unitary_shape.append(2**reg.bitsize)
-                outgoing_reg = _outgoing[reg.name]
-                if isinstance(outgoing_reg, np.ndarray):
-                    soquets.append(outgoing_reg.ravel()[i])
-                else:
-                    soquets.append(outgoing_reg)
+            outgoing_reg = _outgoing[reg.name]
+            if isinstance(outgoing_reg, np.ndarray):
+                soquets.extend(outgoing_reg.ravel().tolist())
+            else:
+                soquets.append(outgoing_reg)
 
         tn.add(
             qtn.Tensor(
                 data=np.eye(2**self.n, 2**self.n).reshape(
-                    tuple(unitary_shape) + (2**self.n,)
+                    self._partitioned_dims + (2**self.n,)
                 ),
                 inds=soquets + [_incoming['x']],
                 tags=['Partition', tag],
             )
         )
 
+    @cached_property
+    def _partitioned_dims(self) -> Tuple[int, ...]:
+        """The tensor index dimension for each element of each partitioned register."""
+        return tuple(2**reg.bitsize for reg in self.regs for _ in reg.all_idxs())
+
+    @cached_property
+    def _reg_layout(self) -> Tuple['NDArray[np.int64]', 'NDArray[np.int64]']:
+        """The bit offsets (`starts`, `sizes`) of each partitioned register within `x`."""
+        sizes = np.fromiter(
+            (reg.total_bits() for reg in self.regs), dtype=np.int64, count=len(self.regs)
+        )
+        starts = np.cumsum(sizes) - sizes
+        sizes.setflags(write=False)
+        starts.setflags(write=False)
+        return starts, sizes
+
     def _classical_partition(self, x: 'ClassicalValT') -> Dict[str, 'ClassicalValT']:
         out_vals = {}
         xbits = ints_to_bits(x, self.n)[0]
-        start = 0
-        for reg in self.regs:
-            size = int(np.prod(reg.shape + (reg.bitsize,)))
+        for reg, start, size in zip(self.regs, *self._reg_layout):
             bits_reg = xbits[start : start + size]
             if reg.shape == ():
                 out_vals[reg.name] = bits_to_ints(bits_reg)[0]
             else:
-                ints_reg = bits_to_ints(
-                    [
-                        bits_reg[i * reg.bitsize : (i + 1) * reg.bitsize]
-                        for i in range(np.prod(reg.shape))
-                    ]
-                )
-                out_vals[reg.name] = np.array(ints_reg).reshape(reg.shape)
-            start += size
+                ints_reg = bits_to_ints(bits_reg.reshape(-1, reg.bitsize))
+                out_vals[reg.name] = ints_reg.reshape(reg.shape)
         return out_vals
 
     def _classical_unpartition(self, **vals: 'ClassicalValT'):
-        out_vals = []
-        for reg in self.regs:
+        xbits = np.empty(self.n, dtype=np.uint8)
+        for reg, start, size in zip(self.regs, *self._reg_layout):
             reg_val = vals[reg.name]
             if isinstance(reg_val, np.ndarray):
-                out_vals.append(ints_to_bits(reg_val.ravel(), reg.bitsize).ravel())
-            else:
-                out_vals.append(ints_to_bits(reg_val, reg.bitsize)[0])
-        big_int = np.concatenate(out_vals)
-        return {'x': bits_to_ints(big_int)[0]}
+                reg_val = reg_val.ravel()
+            xbits[start : start + size] = ints_to_bits(reg_val, reg.bitsize).ravel()
+        return {'x': bits_to_ints(xbits)[0]}
+
+    @cached_property
+    def _all_regs_scalar(self) -> bool:
+        return all(reg.shape == () for reg in self.regs)
+
+    @cached_property
+    def _scalar_shifts_and_masks(self) -> Tuple[Tuple[str, int, int], ...]:
+        """`(name, shift, mask)` for extracting each (scalar) register from `x`."""
+        out = []
+        pos = self.n
+        for reg in self.regs:
+            pos -= reg.bitsize
+            out.append((reg.name, pos, (1 << reg.bitsize) - 1))
+        return tuple(out)
+
+    def _classical_partition_scalar(self, x: int) -> Dict[str, 'ClassicalValT']:
+        return {name: (x >> shift) & mask for name, shift, mask in self._scalar_shifts_and_masks}
+
+    def _classical_unpartition_scalar(self, **vals: 'ClassicalValT') -> Dict[str, 'ClassicalValT']:
+        x = 0
+        for name, shift, mask in self._scalar_shifts_and_masks:
+            val = int(vals[name])
+            if not 0 <= val <= mask:
+                raise ValueError(f"{name}={val} does not fit in {mask.bit_length()} unsigned bits.")
+            x |= val << shift
+        return {'x': x}
 
     def on_classical_vals(self, **vals: 'ClassicalValT') -> Dict[str, 'ClassicalValT']:
+        if self._all_regs_scalar:
+            # Plain integer shifts and masks; no need to round-trip through bit arrays.
+            if self.partition:
+                return self._classical_partition_scalar(int(vals['x']))
+            return self._classical_unpartition_scalar(**vals)
         if self.partition:
             return self._classical_partition(vals['x'])
         else:
@@ -17,9 +17,10 @@ from typing import Dict
 
 import cirq
 import numpy as np
+import pytest
 from attrs import frozen
 
-from qualtran import Bloq, BloqBuilder, QAny, Register, Signature, Soquet, SoquetT
+from qualtran import Bloq, BloqBuilder, QAny, QInt, QUInt, Register, Signature, Soquet, SoquetT
 from qualtran._infra.gate_with_registers import get_named_qubits
 from qualtran.bloqs.basic_gates import CNOT
 from qualtran.bloqs.bookkeeping import Partition
@@ -101,5 +102,33 @@ def test_partition_call_classically():
     assert out[0] == 64
 
 
+def test_partition_call_classically_scalar_regs():
+    regs = (Register('xx', QAny(2)), Register('yy', QAny(37)), Register('zz', QAny(1)))
+    bloq = Partition(n=40, regs=regs)
+    x = 0b10_1000000000000000000000000000000000011_1
+    xx, yy, zz = bloq.call_classically(x=x)
+    assert (xx, yy, zz) == (2, 2**36 + 3, 1)
+    (out,) = bloq.adjoint().call_classically(xx=xx, yy=yy, zz=zz)
+    assert out == x
+
+    # Scalar registers don't go through 64-bit bitstrings, so wider partitions work too.
+    regs = (Register('xx', QAny(37)), Register('yy', QAny(63)))
+    bloq = Partition(n=100, regs=regs)
+    x = (5 << 63) | 7
+    assert bloq.call_classically(x=x) == (5, 7)
+    assert bloq.adjoint().call_classically(xx=5, yy=7) == (x,)
+
+
+def test_partition_call_classically_scalar_regs_out_of_range():
+    regs = (Register('a', QInt(4)), Register('b', QUInt(4)))
+    bloq = Partition(n=8, regs=regs, partition=False)
+    with pytest.raises(ValueError, match=r'a=-3'):
+        bloq.call_classically(a=-3, b=1)
+
+    bloq = Partition(n=8, regs=(Register('a', QAny(4)), Register('b', QAny(4))), partition=False)
+    with pytest.raises(ValueError, match=r'b=16'):
+        bloq.on_classical_vals(a=1, b=16)
+
+
 def test_no_circular_import():
     subprocess.check_call(['python', '-c', 'from qualtran.bloqs.bookkeeping import partition'])
@@ -11,7 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, Dict, Iterator, Optional, Sequence, Set, Tuple, TYPE_CHECKING, Union
 
 import attrs
@@ -94,6 +94,15 @@ class PhaseGradientUnitary(GateWithRegisters):
         )
 
 
+@lru_cache(maxsize=64)
+def _phase_gradient_state_vector(bitsize: int, exponent: float) -> NDArray[np.complex128]:
+    """The (read-only) state vector prepared by `PhaseGradientState(bitsize, exponent)`."""
+    k = np.arange(2**bitsize)
+    state = np.exp(2j * np.pi * exponent * k / 2**bitsize) / np.sqrt(2**bitsize)
+    state.setflags(write=False)
+    return state
+
+
 @attrs.frozen
 class PhaseGradientState(GateWithRegisters):
     r"""Prepare a phase gradient state $|\phi\rangle$ on a new register of bitsize $b_{grad}$
@@ -138,6 +147,27 @@ class PhaseGradientState(GateWithRegisters):
             phase_grad=phase_grad
         )
 
+    def add_my_tensors(
+        self,
+        tn: 'qtn.TensorNetwork',
+        tag: Any,
+        *,
+        incoming: Dict[str, 'SoquetT'],
+        outgoing: Dict[str, 'SoquetT'],
+    ):
+        if isinstance(self.bitsize, sympy.Expr):
+            return super().add_my_tensors(tn, tag, incoming=incoming, outgoing=outgoing)
+
+        import quimb.tensor as qtn
+
+        tn.add(
+            qtn.Tensor(
+                data=_phase_gradient_state_vector(self.bitsize, self.exponent),
+                inds=(outgoing['phase_grad'],),
+                tags=[str(self), tag],
+            )
+        )
+
 
 @attrs.frozen
 class AddIntoPhaseGrad(GateWithRegisters, cirq.ArithmeticGate):  # type: ignore[misc]
@@ -54,6 +54,7 @@ def test_phase_gradient_state_tensor_contract(n: int, t: float):
     state_coefs = 1 / np.sqrt(2**n) * np.array([omega**k for k in range(2**n)])
     bloq = PhaseGradientState(n, t)
     np.testing.assert_allclose(state_coefs, bloq.tensor_contract())
+    np.testing.assert_allclose(state_coefs, bloq.decompose_bloq().tensor_contract())
 
     bb = BloqBuilder()
     phase_reg = bb.add(bloq)
@@ -73,6 +73,7 @@ References:
 
 """
 
+from functools import cached_property
 from typing import cast, Dict, Iterable, List, Sequence, Tuple
 
 import attrs
@@ -84,6 +85,7 @@ from qualtran import (
     bloq_example,
     BloqBuilder,
     BloqDocSpec,
+    CompositeBloq,
     GateWithRegisters,
     QAny,
     Register,
@@ -153,6 +155,15 @@ class StatePreparationViaRotations(GateWithRegisters):
             phase_gradient=self.phase_bitsize,
         )
 
+    @cached_property
+    def _decomposition(self) -> CompositeBloq:
+        return super().decompose_bloq()
+
+    def decompose_bloq(self) -> CompositeBloq:
+        # Synthesizing the rotation angles is expensive and the result only depends on the
+        # (frozen) attributes of this bloq, so the decomposition is computed once per instance.
+        return self._decomposition
+
     def build_composite_bloq(self, bb: BloqBuilder, **soqs: SoquetT) -> Dict[str, SoquetT]:
         r"""Parameters:
         * prepare_control: only if control_bitsize != 0
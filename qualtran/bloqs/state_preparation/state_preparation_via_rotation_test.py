@@ -36,6 +36,11 @@ def test_state_prep_via_rotation(bloq_autotester):
     bloq_autotester(_state_prep_via_rotation)
 
 
+def test_state_prep_via_rotation_decomposition_is_cached():
+    qsp = _state_prep_via_rotation.make()
+    assert qsp.decompose_bloq() is qsp.decompose_bloq()
+
+
 # these states can be prepared exactly with the given phase_bitsize
 @pytest.mark.parametrize(
     "phase_bitsize, state_coefs",
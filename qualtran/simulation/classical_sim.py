@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 """Functionality for the `Bloq.call_classically(...)` protocol."""
+import functools
 import itertools
 from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple, Type, Union
 
@@ -37,6 +38,14 @@ from qualtran._infra.composite_bloq import _binst_to_cxns
 ClassicalValT = Union[int, np.integer, NDArray[np.integer]]
 
 
+@functools.lru_cache(maxsize=128)
+def _big_endian_shifts(w: int) -> NDArray[np.uint64]:
+    """The (read-only) bit shifts `[w-1, ..., 1, 0]` for big-endian bitstrings of width `w`."""
+    shifts = np.arange(w - 1, 0 - 1, -1, dtype=np.uint64)
+    shifts.setflags(write=False)
+    return shifts
+
+
 def bits_to_ints(bitstrings: Union[Sequence[int], NDArray[np.uint]]) -> NDArray[np.uint]:
     """Returns the integer specified by the given big-endian bitstrings.
 
@@ -48,8 +57,11 @@ def bits_to_ints(bitstrings: Union[Sequence[int], NDArray[np.uint]]) -> NDArray[
     bitstrings = np.atleast_2d(bitstrings)
     if bitstrings.shape[1] > 64:
         raise NotImplementedError()
-    basis = 2 ** np.arange(bitstrings.shape[1] - 1, 0 - 1, -1, dtype=np.uint64)
-    return np.sum(basis * bitstrings, axis=1)
+    # Left-pad each bitstring to 64 bits and reinterpret the packed bytes as big-endian uint64.
+    n, w = bitstrings.shape
+    padded = np.zeros((n, 64), dtype=np.uint8)
+    padded[:, 64 - w :] = bitstrings
+    return np.packbits(padded, axis=1).view('>u8').ravel().astype(np.uint64)
 
 
 def ints_to_bits(
@@ -67,8 +79,8 @@ def ints_to_bits(
         assert np.iinfo(x.dtype).bits <= 64
         x = x.astype(np.uint64)
     assert w <= np.iinfo(x.dtype).bits
-    mask = 2 ** np.arange(w - 1, 0 - 1, -1, dtype=x.dtype).reshape((w, 1))
-    return (x & mask).astype(bool).astype(np.uint8).T
+    shifts = _big_endian_shifts(w)
+    return ((x[..., np.newaxis] >> shifts) & 1).astype(np.uint8)
 
 
 def _get_in_vals(
@@ -249,11 +261,13 @@ def get_classical_truth_table(
         iters.append(reg.dtype.get_classical_domain())
     out_names: List[str] = [reg.name for reg in bloq.signature.rights()]
 
+    # Equivalent to `bloq.call_classically` for each entry, but only wraps `bloq` once.
+    cbloq = bloq.as_composite_bloq()
     truth_table: List[Tuple[Sequence[Any], Sequence[Any]]] = []
     for in_val_tuple in itertools.product(*iters):
         in_val_d = {name: val for name, val in zip(in_names, in_val_tuple)}
-        out_val_tuple = bloq.call_classically(**in_val_d)
-        # out_val_d = {name: val for name, val in zip(out_names, out_val_tuple)}
+        out_val_d = cbloq.on_classical_vals(**in_val_d)
+        out_val_tuple = tuple(out_val_d[name] for name in out_names)
         truth_table.append((in_val_tuple, out_val_tuple))
     return in_names, out_names, truth_table
 
@@ -43,6 +43,9 @@ def test_bits_to_int():
         ref_num = cirq.big_endian_bits_to_int(bs.tolist())
         assert num == ref_num
 
+    # check uint8 input bitstrings.
+    np.testing.assert_array_equal(bits_to_ints(bitstrings.astype(np.uint8)), nums)
+
     # check one input bitstring instead of array of input bitstrings.
     (num,) = bits_to_ints([1, 0])
     assert num == 2